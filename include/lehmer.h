@@ -317,6 +317,20 @@ int32_t lehmer_generate_gamma(int32_t seed);
  */
 int32_t lehmer_generate_delta(int32_t seed);
 
+/**
+ * @brief Implementation of the binding function for the Lehmer LCG PRNG
+ *
+ * This function combines gamma and delta to recover the original Lehmer
+ * sequence without overflowing intermediate results.
+ *
+ * \f(z) = \gamma(z) + m \cdot \delta(z)
+ *
+ * @param[in] seed An integer representing the current seed.
+ *
+ * @return An integer representing the next seed in the sequence.
+ */
+int32_t lehmer_generate_binder(int32_t seed);
+
 /**
  * @brief The Lehmer Random Number Generator with a jump multiplier is a
  * variation of the original Lehmer’s RNG, which aims to further reduce
@@ -371,6 +385,58 @@ void lehmer_generate_time(lehmer_state_t* state, lehmer_generate_t generator);
  */
 void lehmer_regenerate(lehmer_state_t* state, lehmer_generate_t generator);
 
+/**
+ * @brief Fill a buffer with seeds from the modulo generator.
+ *
+ * Produces the same values as lehmer_generate with lehmer_generate_modulo,
+ * but steps the recurrence inline rather than through a callback.
+ *
+ * @param output The buffer receiving seeds in the range [0, m).
+ * @param seed The seed preceding the first generated value.
+ * @param length The number of seeds to generate.
+ */
+void lehmer_generate_batch(int32_t* output, int32_t seed, uint32_t length);
+
+/**
+ * @brief Fill a buffer with normalized values from the modulo generator.
+ *
+ * The recurrence and the normalization run in a single pass without a state
+ * object, so callers can stream values directly into their own memory.
+ *
+ * @param output The buffer receiving values in the range [0.0, 1.0).
+ * @param seed The seed preceding the first generated value.
+ * @param length The number of values to generate.
+ */
+void lehmer_generate_stream(double* output, int32_t seed, uint32_t length);
+
+/**
+ * @brief Fill a buffer with single precision values from the modulo generator.
+ *
+ * Each value keeps the top 24 bits of the seed, which a float represents
+ * exactly, so the output halves the bandwidth of lehmer_generate_stream and
+ * never rounds up to 1.0.
+ *
+ * @param output The buffer receiving values in the range [0.0, 1.0).
+ * @param seed The seed preceding the first generated value.
+ * @param length The number of values to generate.
+ */
+void lehmer_generate_stream_f32(float* output, int32_t seed, uint32_t length);
+
+/**
+ * @brief Fill a buffer with Bernoulli outcomes from the modulo generator.
+ *
+ * Each outcome is 1 when the normalized value falls below p. The comparison
+ * is made against p * m directly, so no normalized value is materialized.
+ *
+ * @param output The buffer receiving outcomes of 0 or 1.
+ * @param seed The seed preceding the first generated value.
+ * @param length The number of outcomes to generate.
+ * @param p The probability of generating a 1.
+ */
+void lehmer_generate_bernoulli(
+    uint8_t* output, int32_t seed, uint32_t length, double p
+);
+
 // Lehmer random number generators
 
 /**
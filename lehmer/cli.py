@@ -8,7 +8,35 @@ Copyright © 2024 Austin Berrio
 @brief CLI tool for validating the Lehmer RNG in pure Python from scratch.
 """
 
-import argparse
+import sys
+from array import array
+from typing import TYPE_CHECKING
+
+from lehmer import native
+from lehmer.pcg import PCG32State
+
+if TYPE_CHECKING:
+    import argparse
+
+# Output line formats, built once rather than per line
+SEED_FORMAT = "Position: %d, Seed: %d"
+NORMALIZED_FORMAT = "Position: %d, Seed: %d, Normalized: %.10f"
+
+
+def _make_stepper(multiplier: int, modulus: int):
+    """Compile a seed generator with the generator constants baked in."""
+    # Literal constants load with LOAD_CONST instead of attribute lookups
+    # NOTE: A generator outpaces itertools.accumulate here, which pays a
+    # Python-level function call per step for the reduction
+    source = (
+        "def steps(seed, length):\n"
+        "    for _ in range(length):\n"
+        f"        seed = ({int(multiplier)} * seed) % {int(modulus)}\n"
+        "        yield seed\n"
+    )
+    namespace = {}
+    exec(compile(source, "<lehmer-stepper>", "exec"), namespace)
+    return namespace["steps"]
 
 
 class LehmerState:
@@ -17,28 +45,32 @@ class LehmerState:
     MODULUS = 2147483647  # Mersenne prime (2^31 - 1)
     MULTIPLIER = 48271  # Chosen multiplier (prime)
 
-    def __init__(self, seed: int, length: int):
+    __slots__ = ("seed", "position", "length", "sequence", "_mask")
+
+    def __init__(self, seed: int, length: int, *, materialize: bool = True):
         """Mimic the C implementation for consistency and validity"""
         # Initialize state variables
         self.seed = seed % self.MODULUS  # Set initial seed
         self.position = 0  # Position in the sequence
         # Set length (coerce length to at least 1)
         self.length = max(1, length)
-        # Allocate space for sequence storage
-        self.sequence = [0] * self.length
+        # Wrap positions with a bitmask when the length is a power of two
+        self._mask = (
+            self.length - 1 if self.length & (self.length - 1) == 0 else None
+        )
+        # Contiguous int32 storage, mirroring the C implementation
+        # NOTE: Without a sequence, the scalar seed is stepped in place
+        self.sequence = array("i") if materialize else None
 
         # Generate the initial sequence
         self.generate_sequence()
 
     def generate_sequence(self) -> None:
         """Generate a Lehmer sequence based on the initial seed."""
-        # Generate the initial seed utilizing root seed
-        self.sequence[0] = (self.MULTIPLIER * self.seed) % self.MODULUS
-        # Generate the rest of the sequence
-        for i in range(1, self.length):
-            self.sequence[i] = (
-                self.MULTIPLIER * self.sequence[i - 1]
-            ) % self.MODULUS
+        if self.sequence is None:
+            return  # Nothing to generate for a scalar state
+
+        self.sequence = _build_sequence(self.seed, self.length)
 
     def set_initial_seed(self, seed: int) -> None:
         """Set the initial seed and regenerate the sequence."""
@@ -55,15 +87,23 @@ class LehmerState:
 
     def set_previous_seed(self) -> None:
         """Set the position to the previous seed in the sequence."""
-        self.position = (self.position - 1) % self.length
+        if self._mask is not None:
+            self.position = (self.position - 1) & self._mask
+        else:
+            self.position = (self.position - 1) % self.length
 
     def set_next_seed(self) -> None:
         """Set the position to the next seed in the sequence."""
-        self.position = (self.position + 1) % self.length
+        if self._mask is not None:
+            self.position = (self.position + 1) & self._mask
+        else:
+            self.position = (self.position + 1) % self.length
 
     def get_current_seed(self) -> int:
         """Get the current seed in the sequence."""
-        self.position %= self.length  # Enforce position boundaries
+        if self.sequence is None:
+            return self.seed
+        # NOTE: Position boundaries are enforced by select() and the setters
         return self.sequence[self.position]
 
     def get_next_seed(self) -> int:
@@ -73,18 +113,89 @@ class LehmerState:
 
     def normalize(self) -> float:
         """Normalize the current seed to a float in the range 0.0 to 1.0."""
-        return self.get_current_seed() / self.MODULUS
+        if self.sequence is None:
+            return self.seed / self.MODULUS
+        return self.sequence[self.position] / self.MODULUS
+
+    def step_all(self, n: int = 1) -> None:
+        """Advance every seed in the sequence by n modulo generator steps."""
+        # Each position is an independent stream, so step them in one pass
+        # NOTE: n steps share one jump multiplier, a^n mod m, across streams
+        multiplier = self.MULTIPLIER if n == 1 else jump(1, n)
+        modulus = self.MODULUS
+        if self.sequence is None:
+            self.seed = (multiplier * self.seed) % modulus
+            return
+        # Write back in place so no temporary buffers are allocated
+        sequence = self.sequence
+        for i, seed in enumerate(sequence):
+            sequence[i] = (multiplier * seed) % modulus
+
+    def advance(self, n: int) -> int:
+        """Jump the current seed ahead by n steps of the modulo generator."""
+        # z_n = a^n * z_0 mod m, so n steps collapse into a single jump
+        if self.sequence is None:
+            self.seed = jump(self.seed, n)
+            return self.seed
+        position, sequence = self.position, self.sequence
+        next_seed = jump(sequence[position], n)
+        # Update seed at the current position
+        sequence[position] = next_seed
+        return next_seed
 
     def modulo(self) -> int:
         """Generate a new pseudo-random seed using the current state."""
-        next_seed = (self.MULTIPLIER * self.get_current_seed()) % self.MODULUS
+        position, sequence = self.position, self.sequence
+        modulus = self.MODULUS
+        if sequence is None:
+            self.seed = (self.MULTIPLIER * self.seed) % modulus
+            return self.seed
+        next_seed = (self.MULTIPLIER * sequence[position]) % modulus
         # Update seed at the current position
-        self.sequence[self.position] = next_seed
+        sequence[position] = next_seed
         return next_seed
 
 
-def get_arguments() -> argparse.Namespace:
+# Specialize the pure Python fallback on the fixed generator constants
+_generate_seeds = _make_stepper(LehmerState.MULTIPLIER, LehmerState.MODULUS)
+
+
+def _build_sequence(seed: int, length: int) -> array:
+    """Generate the int32 sequence for a seed and length."""
+    # Prefer the compiled library, which fills a zeroed buffer in place
+    if native.load_library() is not None:
+        sequence = array("i", [0]) * length
+        native.generate_sequence(sequence, seed)
+    else:
+        # Build the buffer straight from the recurrence, skipping the prefill
+        sequence = array("i", _generate_seeds(seed, length))
+    return sequence
+
+
+# Precompute a^(2^i) mod m so any jump is composed from the bits of n
+_JUMP_POW2 = [LehmerState.MULTIPLIER]
+for _ in range(30):
+    _JUMP_POW2.append((_JUMP_POW2[-1] * _JUMP_POW2[-1]) % LehmerState.MODULUS)
+
+
+def jump(seed: int, n: int) -> int:
+    """Jump a seed ahead by n steps of the modulo generator."""
+    modulus = LehmerState.MODULUS
+    # a^(m - 1) = 1 (mod m), so the step count wraps at m - 1
+    n %= modulus - 1
+    for power in _JUMP_POW2:
+        if not n:
+            break
+        if n & 1:
+            seed = (seed * power) % modulus
+        n >>= 1
+    return seed
+
+
+def get_arguments() -> "argparse.Namespace":
     """Set up and parse command-line arguments for the Lehmer RNG generator."""
+    import argparse  # Deferred so library imports skip the parser setup
+
     parser = argparse.ArgumentParser(
         description="Lehmer RNG seed generator and sequence explorer.",
         epilog=(
@@ -137,6 +248,16 @@ def get_arguments() -> argparse.Namespace:
             "Default is 48271."
         ),
     )
+    parser.add_argument(
+        "-r",
+        "--rng",
+        choices=("lehmer", "pcg"),
+        default="lehmer",
+        help=(
+            "Generator to use. 'pcg' steps independent PCG32 lanes together "
+            "and reads them interleaved. Default is lehmer."
+        ),
+    )
 
     # Iteration and normalization control
     parser.add_argument(
@@ -177,40 +298,87 @@ def get_arguments() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def run_pcg(args, verbose: bool) -> None:
+    """Generate the requested outputs from interleaved PCG32 lanes."""
+    pcg_rng = PCG32State(seed=args.seed)
+    # Include the value at the final position for non-verbose output
+    outputs = pcg_rng.generate(args.iterations + 1)
+
+    if not verbose:
+        if not args.quiet:
+            print(f"Final Seed: {outputs[-1]}")
+        return
+
+    print(f"Initial seed: {args.seed}")
+    print(f"Lanes: {pcg_rng.lanes}")
+    if args.normalize:
+        lines = [
+            NORMALIZED_FORMAT % (i, value, pcg_rng.normalize(value))
+            for i, value in enumerate(outputs[:-1])
+        ]
+    else:
+        lines = [
+            SEED_FORMAT % (i, value) for i, value in enumerate(outputs[:-1])
+        ]
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
 def main():
     args = get_arguments()
+    verbose = args.verbose and not args.quiet
+    # Negative iterations run no steps, matching lehmer.simple
+    args.iterations = max(0, args.iterations)
+
+    if args.rng == "pcg":
+        run_pcg(args, verbose)
+        return
 
     # Create an instance of LehmerState using the parsed arguments
+    # NOTE: The sequence is only materialized when every seed is displayed
     lehmer_rng = LehmerState(
         seed=args.seed,
         length=args.length,
+        materialize=verbose,
     )
 
-    # Print initial state if verbose is enabled
-    if args.verbose and not args.quiet:
-        print(f"Initial seed: {lehmer_rng.seed}")
-        print(f"Sequence length: {lehmer_rng.length}")
-
-    # Display the generated sequence
-    for i in range(args.iterations):
-        seed_value = lehmer_rng.get_current_seed()
-        if args.normalize:
-            normalized_value = lehmer_rng.normalize()
-            output = f"Position: {i}, Seed: {seed_value}, Normalized: {normalized_value:.10f}"
-        else:
-            output = f"Position: {i}, Seed: {seed_value}"
+    # Only the final seed is observed, so jump straight to it
+    if not verbose:
+        # The seed at position k is a^(k + 1) * z mod m
+        lehmer_rng.advance(args.iterations % lehmer_rng.length + 1)
+        if not args.quiet:
+            print(f"Final Seed: {lehmer_rng.get_current_seed()}")
+        return
 
-        # Print each value if verbose, otherwise only the last value
-        if args.verbose and not args.quiet:
-            print(output)
-
-        lehmer_rng.set_next_seed()
+    # Print initial state if verbose is enabled
+    print(f"Initial seed: {lehmer_rng.seed}")
+    print(f"Sequence length: {lehmer_rng.length}")
+
+    # Bind the state as locals to keep the formatting lean
+    modulus = LehmerState.MODULUS
+    sequence, length = lehmer_rng.sequence, lehmer_rng.length
+    position = lehmer_rng.position
+
+    # Walk the sequence by rotating and repeating the buffer in one pass
+    rotated = sequence[position:] + sequence[:position]
+    seeds = (rotated * (args.iterations // length + 1))[: args.iterations]
+
+    # Format the generated sequence and emit it with a single write
+    if args.normalize:
+        normalized = [seed / modulus for seed in seeds]
+        lines = [
+            NORMALIZED_FORMAT % (i, seed, value)
+            for i, (seed, value) in enumerate(zip(seeds, normalized))
+        ]
     else:
-        seed_value = lehmer_rng.get_current_seed()
+        lines = [SEED_FORMAT % (i, seed) for i, seed in enumerate(seeds)]
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    # Final output for non-verbose mode
-    if not args.verbose and not args.quiet:
-        print(f"Final Seed: {seed_value}")
+    # Write the final position back to the state
+    lehmer_rng.position = (position + args.iterations) % length
 
 
 if __name__ == "__main__":
@@ -2,7 +2,9 @@
 Script: lehmer.gamma
 """
 
-from concurrent.futures import ThreadPoolExecutor
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 
 seed = 1337
 MODULUS = 2147483647
@@ -10,21 +12,34 @@ MULTIPLIER = 48271
 BATCH_SIZE = 10000  # Number of seeds to generate per batch
 
 
-# g(z) = a * (z mod q) - r * (z // q)
-def gamma(z: int, a: int, m: int) -> int:
-    q = m // a
-    r = m % a
-    return (a * (z % q) - r * (z // q)) % m
+# Precompute a^k mod m for k = 1, ..., n
+def multiplier_powers(n: int) -> list:
+    powers = []
+    power = 1
+    for _ in range(n):
+        power = (power * MULTIPLIER) % MODULUS
+        powers.append(power)
+    return powers
+
+
+# z_k = a^k * z_0 mod m, so one batch needs no serial dependency chain
+A_POW = multiplier_powers(BATCH_SIZE)
 
 
 # Generate a batch of seeds
 def generate_batch(seed: int, batch_size: int) -> list:
-    z = seed
-    batch = []
-    for _ in range(batch_size):
-        z = gamma(z, MULTIPLIER, MODULUS)
-        batch.append(z)
-    return batch
+    if batch_size <= BATCH_SIZE:
+        powers = A_POW
+    else:
+        powers = multiplier_powers(batch_size)
+    m = MODULUS
+    z = seed % m
+    return [(power * z) % m for power in powers[:batch_size]]
+
+
+# Pack a batch as int32 so workers ship bytes rather than pickled ints
+def generate_batch_bytes(seed: int, batch_size: int) -> bytes:
+    return array("i", generate_batch(seed, batch_size)).tobytes()
 
 
 # Batch processing function
@@ -38,21 +53,29 @@ def process_batches(initial_seed, num_batches, batch_size):
     return seeds
 
 
-# Threaded version
+# Parallel version
 def threaded_batch_processing(seed, total_seeds, batch_size):
     num_batches = total_seeds // batch_size
-    with ThreadPoolExecutor() as executor:
-        results = list(
-            executor.map(
-                generate_batch,
-                [seed] * num_batches,
-                [batch_size] * num_batches,
-            )
-        )
+    # Jump each batch ahead by b * batch_size steps: z_b = J^b * z_0 mod m
+    jump = pow(MULTIPLIER, batch_size, MODULUS)
+    seeds = [
+        (pow(jump, b, MODULUS) * seed) % MODULUS for b in range(num_batches)
+    ]
 
-    # Flatten batches
-    seeds = [item for sublist in results for item in sublist]
-    return seeds
+    # Processes sidestep the GIL, which serializes pure Python arithmetic
+    workers = os.cpu_count() or 1
+    output = array("i")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        batches = executor.map(
+            generate_batch_bytes,
+            seeds,
+            [batch_size] * num_batches,
+            chunksize=max(1, num_batches // (4 * workers)),
+        )
+        # Append each batch into one contiguous buffer, never boxing the seeds
+        for batch in batches:
+            output.frombytes(batch)
+    return output
 
 
 if __name__ == "__main__":
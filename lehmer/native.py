@@ -0,0 +1,121 @@
+"""
+Copyright © 2024 Austin Berrio
+
+@file lehmer/native.py
+
+@brief Optional ctypes binding to the compiled liblehmer shared library.
+
+The library is produced by the CMake build under build/lib. Set the
+LEHMER_LIBRARY environment variable to load it from another location.
+Every helper reports whether the library was used so callers can fall
+back to their pure Python implementation.
+"""
+
+import ctypes
+import ctypes.util
+import functools
+import os
+from pathlib import Path
+
+
+def find_library() -> str | None:
+    """Locate liblehmer, preferring LEHMER_LIBRARY and the local build tree."""
+    path = os.environ.get("LEHMER_LIBRARY")
+    if path:
+        return path
+    build = Path(__file__).resolve().parent.parent / "build" / "lib"
+    for name in ("liblehmer.so", "liblehmer.dylib"):
+        if (build / name).exists():
+            return str(build / name)
+    return ctypes.util.find_library("lehmer")
+
+
+@functools.cache
+def load_library() -> ctypes.CDLL | None:
+    """Load liblehmer once and declare the bound signatures."""
+    path = find_library()
+    if path is None:
+        return None
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError:
+        return None
+
+    # A stale build or an unrelated liblehmer may lack these symbols
+    try:
+        lib.lehmer_generate_batch.argtypes = [
+            ctypes.POINTER(ctypes.c_int32),
+            ctypes.c_int32,
+            ctypes.c_uint32,
+        ]
+        lib.lehmer_generate_batch.restype = None
+
+        lib.lehmer_generate_stream.argtypes = [
+            ctypes.POINTER(ctypes.c_double),
+            ctypes.c_int32,
+            ctypes.c_uint32,
+        ]
+        lib.lehmer_generate_stream.restype = None
+
+        lib.lehmer_generate_stream_f32.argtypes = [
+            ctypes.POINTER(ctypes.c_float),
+            ctypes.c_int32,
+            ctypes.c_uint32,
+        ]
+        lib.lehmer_generate_stream_f32.restype = None
+
+        lib.lehmer_generate_bernoulli.argtypes = [
+            ctypes.POINTER(ctypes.c_uint8),
+            ctypes.c_int32,
+            ctypes.c_uint32,
+            ctypes.c_double,
+        ]
+        lib.lehmer_generate_bernoulli.restype = None
+    except AttributeError:
+        return None
+    return lib
+
+
+def generate_sequence(sequence, seed: int) -> bool:
+    """Fill an int32 buffer with the modulo sequence for the given seed."""
+    lib = load_library()
+    if lib is None or not sequence:
+        return False
+
+    # Borrow the buffer in place rather than copying it into C memory
+    buffer = (ctypes.c_int32 * len(sequence)).from_buffer(sequence)
+    lib.lehmer_generate_batch(buffer, seed, len(sequence))
+    return True
+
+
+def generate_stream(output, seed: int) -> bool:
+    """Fill a double buffer with normalized values following the given seed."""
+    lib = load_library()
+    if lib is None or not output:
+        return False
+
+    buffer = (ctypes.c_double * len(output)).from_buffer(output)
+    lib.lehmer_generate_stream(buffer, seed, len(output))
+    return True
+
+
+def generate_stream_f32(output, seed: int) -> bool:
+    """Fill a float buffer with single precision values following the seed."""
+    lib = load_library()
+    if lib is None or not output:
+        return False
+
+    buffer = (ctypes.c_float * len(output)).from_buffer(output)
+    lib.lehmer_generate_stream_f32(buffer, seed, len(output))
+    return True
+
+
+def generate_bernoulli(output, seed: int, p: float) -> bool:
+    """Fill a byte buffer with Bernoulli outcomes following the given seed."""
+    lib = load_library()
+    if lib is None or not output:
+        return False
+
+    buffer = (ctypes.c_uint8 * len(output)).from_buffer(output)
+    lib.lehmer_generate_bernoulli(buffer, seed, len(output), p)
+    return True
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+"""
+Copyright © 2024 Austin Berrio
+
+@file lehmer/pcg.py
+
+@brief Multi-lane PCG32 (XSH-RR) generator in pure Python from scratch.
+
+Each lane is an independent PCG32 stream selected by a distinct odd
+increment, so lanes have no data dependency on one another and can be
+stepped together. Lanes are read interleaved as a single output stream.
+
+@ref PCG: A Family of Simple Fast Space-Efficient Statistically Good
+Algorithms for Random Number Generation
+@cite https://www.pcg-random.org/paper.html
+"""
+
+
+class PCG32State:
+    """Lockstep PCG32 lanes for batched sequence generation."""
+
+    MULTIPLIER = 6364136223846793005  # 64-bit LCG multiplier
+    MASK64 = 0xFFFFFFFFFFFFFFFF  # Wrap state to 64 bits
+    MASK32 = 0xFFFFFFFF  # Wrap output to 32 bits
+    LANES = 8  # Default number of independent streams
+
+    __slots__ = ("state", "increment")
+
+    def __init__(self, seed: int, lanes: int = LANES):
+        """Seed every lane with the same seed on its own stream."""
+        lanes = max(1, lanes)
+        # Lane k selects stream k, which must map to an odd increment
+        self.increment = [((k << 1) | 1) & self.MASK64 for k in range(lanes)]
+        self.state = [0] * lanes
+
+        # Mirror pcg32_srandom_r: step, mix in the seed, step again
+        self.step()
+        self.state = [(state + seed) & self.MASK64 for state in self.state]
+        self.step()
+
+    @property
+    def lanes(self) -> int:
+        """Return the number of lanes."""
+        return len(self.state)
+
+    def step(self) -> list[int]:
+        """Advance every lane once and return one 32-bit output per lane."""
+        multiplier, mask64, mask32 = self.MULTIPLIER, self.MASK64, self.MASK32
+        outputs = []
+        for k, state in enumerate(self.state):
+            self.state[k] = (state * multiplier + self.increment[k]) & mask64
+            # XSH-RR: xorshift the high bits, then rotate by the top 5 bits
+            xorshifted = (((state >> 18) ^ state) >> 27) & mask32
+            rotation = state >> 59
+            outputs.append(
+                ((xorshifted >> rotation) | (xorshifted << (-rotation & 31)))
+                & mask32
+            )
+        return outputs
+
+    def generate(self, n: int) -> list[int]:
+        """Return n outputs, reading the lanes interleaved."""
+        outputs = []
+        while len(outputs) < n:
+            outputs.extend(self.step())
+        return outputs[:n]
+
+    def normalize(self, value: int) -> float:
+        """Normalize an output to a float in the range 0.0 to 1.0."""
+        return value / (self.MASK32 + 1)
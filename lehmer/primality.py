@@ -8,7 +8,8 @@ Module: lehmer/primality.py
 Pre-calculated Mersenne prime tables do exist.
 https://www.mersenne.org/primes/
 
-Miller-Rabin primality test may be helpful.
+A deterministic Miller-Rabin primality test validates the moduli, since
+trial division is infeasible for 2^61 - 1.
 https://www.geeksforgeeks.org/primality-test-set-3-miller-rabin/
 
 NOTE: Large prime values are both computationally complex and expensive.
@@ -29,17 +30,68 @@ TRUSTED_MODULI = [
 ]
 
 
-def is_prime(n):
-    if n < 2:
-        return False
-    i = 2
-    while i * i <= n:
-        if n % i == 0:
+# Deterministic Miller-Rabin witnesses for n < WITNESS_LIMIT (covers 64-bit)
+WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# Smallest strong pseudoprime to every witness, about 3.18 * 10^23
+WITNESS_LIMIT = 318665857834031151167461
+
+# Below this bound trial division beats running every witness
+# NOTE: For prime inputs, the worst case for the wheel, trial division is
+# faster up to about 2^19 (5 * 10^5) and slower from 2^20 (10^6) upward
+TRIAL_LIMIT = 1 << 19
+
+
+def miller_rabin(n: int, witnesses: tuple = WITNESSES) -> bool:
+    """Return True if odd n > 2 is a strong probable prime to every witness."""
+    # Write n - 1 = d * 2^s with d odd, shared by every witness
+    d, s = n - 1, 0
+    while d & 1 == 0:
+        d >>= 1
+        s += 1
+
+    # n is a strong probable prime to base a if a^d = 1 or a^(d * 2^i) = -1
+    for a in witnesses:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = (x * x) % n
+            if x == n - 1:
+                break
+        else:
             return False
-        i += 1
     return True
 
 
+def is_prime(n: int) -> bool:
+    """
+    Return True if n is prime.
+
+    NOTE: The result is exact for n < WITNESS_LIMIT. Above it a True result
+    only means n is a strong probable prime to every witness, and composites
+    such as WITNESS_LIMIT itself are reported as prime.
+    """
+    if n < 2:
+        return False
+    # Dividing by the witnesses settles small and even inputs up front
+    for p in WITNESSES:
+        if n % p == 0:
+            return n == p
+
+    # Continue trial division on the 6k +/- 1 wheel, skipping multiples of 2, 3
+    if n < TRIAL_LIMIT:
+        i = 41  # The first 6k - 1 candidate past the witnesses
+        while i * i <= n:
+            if n % i == 0 or n % (i + 2) == 0:
+                return False
+            i += 6
+        return True
+
+    # n is composite if any witness fails the strong probable prime test
+    return miller_rabin(n)
+
+
 def test_lehmer_primality() -> None:
     print("Testing Lehmer RNG parameters")
     for prime in TRUSTED_MULTIPLIERS:
@@ -9,7 +9,12 @@ Copyright © 2024 Austin Berrio
 pure Python from scratch.
 """
 
-import argparse
+import sys
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
 
 MODULUS = 2147483647
 MULTIPLIER = 48271
@@ -20,14 +25,34 @@ def lehmer_generate_modulo(seed: int) -> int:
     return (MULTIPLIER * seed) % MODULUS
 
 
+def lehmer_generate_advance(seed: int, iterations: int) -> int:
+    """Jump the seed ahead by the given number of iterations."""
+    if iterations <= 0:
+        return seed  # A negative exponent would invert a and step backwards
+    # z_n = a^n * z_0 mod m, so n steps collapse into a modular exponentiation
+    return (pow(MULTIPLIER, iterations, MODULUS) * seed) % MODULUS
+
+
+def lehmer_generate_sequence(seed: int, iterations: int) -> array:
+    """Collect every intermediate seed into a contiguous int32 buffer."""
+    sequence = array("i", bytes(4 * max(0, iterations)))  # Preallocate
+    seed %= MODULUS  # Bind the seed to the int32 range
+    for i in range(iterations):
+        seed = lehmer_generate_modulo(seed)
+        sequence[i] = seed
+    return sequence
+
+
 # NOTE: Normalization "generates" the pseudo random number
 def lehmer_seed_normalize(seed: int) -> float:
     """Normalize the seed as a ratio of the modulus."""
     return seed / MODULUS
 
 
-def get_arguments() -> argparse.Namespace:
+def get_arguments() -> "argparse.Namespace":
     """Set and parse the command-line arguments."""
+    import argparse  # Deferred so library imports skip the parser setup
+
     parser = argparse.ArgumentParser(description="Lehmer RNG seed generator.")
     parser.add_argument(
         "-s",
@@ -62,10 +87,17 @@ if __name__ == "__main__":
     args = get_arguments()
 
     seed = args.seed
-    for i in range(args.iterations):
-        seed = lehmer_generate_modulo(seed)
-        if args.verbose:
-            print(f"Iteration {i + 1}: seed = {seed}")
+    if args.verbose and args.iterations > 0:
+        # Compute every seed first, then format them from the buffer
+        sequence = lehmer_generate_sequence(seed, args.iterations)
+        lines = [
+            "Iteration %d: seed = %d" % (i, value)
+            for i, value in enumerate(sequence, 1)
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        seed = sequence[-1]
+    else:
+        seed = lehmer_generate_advance(seed, args.iterations)
 
     last_iteration = args.iterations
     print(f"After {last_iteration} iterations: seed = {seed}")
@@ -9,8 +9,14 @@ NOTE: Test for correctness in implementation,
       not for randomness in output.
 """
 
+import random
+import subprocess
+import sys
 
-from lehmer.generator import Lehmer
+from lehmer.generator import Lehmer, LehmerPool
+from lehmer.pcg import PCG32State
+from lehmer.primality import is_prime
+from lehmer.simple import lehmer_generate_sequence
 
 #
 # simple tests
@@ -40,23 +46,165 @@ def test_generate_sequence():
     assert all(abs(a - b) < 1e-9 for a, b in zip(sequence, expected))
 
 
+def test_stream():
+    rng = Lehmer(123456789)
+    expected = [rng.y_random() for _ in range(1000)]
+    rng.z = 123456789
+    sequence = rng.stream(1000)
+    assert len(sequence) == 1000
+    assert all(abs(a - b) < 1e-9 for a, b in zip(sequence, expected))
+    assert rng.normalize() == expected[-1]
+
+
+def test_generate_batch():
+    rng = Lehmer(123456789)
+    expected = []
+    for _ in range(1000):
+        rng.z = rng.generate()
+        expected.append(rng.z)
+    rng.z = 123456789
+    assert list(rng.generate_batch(1000)) == expected
+    assert rng.z == expected[-1]
+
+
+def test_iter():
+    rng = Lehmer(123456789)
+    expected = [rng.generate_batch(1)[0] for _ in range(3000)]
+    rng = Lehmer(123456789)
+    assert [seed for seed, _ in zip(rng, range(3000))] == expected
+
+
+def test_advance():
+    rng = Lehmer(123456789)
+    expected = [rng.random() for _ in range(1000)][-1]
+    rng = Lehmer(123456789)
+    rng.advance(1000)
+    assert rng.normalize() == expected
+
+
+def test_spawn():
+    rng = Lehmer(123456789)
+    children = rng.spawn(4) + rng.spawn(4)
+    seeds = [child.z for child in children]
+    assert len(set(seeds)) == 8
+    assert all(0 < seed < rng.m for seed in seeds)
+    assert seeds[:4] == [child.z for child in Lehmer(123456789).spawn(4)]
+
+
+def test_pool():
+    pool = LehmerPool.from_seed(123456789, 4, 1000)
+    rngs = [Lehmer(z) for z in pool.state]
+    for _ in range(10):
+        assert pool.random() == [rng.random() for rng in rngs]
+    rng = Lehmer(123456789)
+    rng.advance(1000)
+    assert LehmerPool.from_seed(123456789, 4, 1000).state[1] == rng.z
+
+    # Streams leap over each other's blocks and together cover the sequence
+    pool = LehmerPool.from_seed(123456789, 4, 3)
+    seeds = [z for _ in range(9) for z in pool.step()]
+    assert sorted(seeds) == sorted(Lehmer(123456789).generate_batch(36))
+
+
+def test_stream_f32():
+    rng = Lehmer(123456789)
+    expected = rng.stream(1000)
+    rng.z = 123456789
+    sequence = rng.stream_f32(1000)
+    assert all(0.0 <= value < 1.0 for value in sequence)
+    assert all(abs(a - b) < 2**-23 for a, b in zip(sequence, expected))
+    # The seed preceding m - 1 yields the largest value, which stays below 1.0
+    assert Lehmer(pow(rng.a, -1, rng.m) * (rng.m - 1)).stream_f32(1)[0] < 1.0
+
+
+def test_bernoulli():
+    rng = Lehmer(123456789)
+    expected = [int(value < 0.3) for value in rng.stream(10_000)]
+    rng.z = 123456789
+    assert list(rng.bernoulli(10_000, 0.3)) == expected
+    assert abs(sum(expected) / len(expected) - 0.3) < 0.01
+
+
+def test_random_array():
+    sequence = Lehmer(123456789).random_array(1000)
+    assert len(sequence) == 1000
+    assert all(0.0 <= value < 1.0 for value in sequence)
+    assert sequence == Lehmer(123456789).random_array(1000)
+
+
 def test_normalize():
     rng = Lehmer(123456789)
     rng.z = 123456789
     assert 0.0 <= rng.normalize() < 1.0
 
 
-def test_full_period():
-    count = 0
-    seed = 1
-    original_seed = seed
-    rng = Lehmer(123456789)
+def test_simple_negative_seed():
+    m = 2**31 - 1
+    sequence = lehmer_generate_sequence(-5, 3)
+    assert list(sequence) == list(lehmer_generate_sequence(m - 5, 3))
+    assert sequence[0] == 48271 * -5 % m
+
+
+def test_pcg32():
+    # Reference output of pcg32-demo for seed 42 on stream 54
+    expected = [
+        0xA15C02B7,
+        0x7B47F409,
+        0xBA1D3330,
+        0x83D2F293,
+        0xBFA4784B,
+        0xCBED606E,
+    ]
+    pcg = PCG32State(42, lanes=55)  # Lane k runs stream k
+    assert [pcg.step()[54] for _ in range(6)] == expected
+    # Lanes are read interleaved as one stream
+    pcg = PCG32State(42)
+    assert PCG32State(42).generate(12) == pcg.step() + pcg.step()[:4]
+
+
+def test_cli_pcg():
+    command = [sys.executable, "-m", "lehmer.cli", "-r", "pcg", "-z", "42"]
+    output = subprocess.run(
+        command + ["-i", "3", "-v"], capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    outputs = PCG32State(42).generate(4)
+    assert output[1] == "Lanes: 8"
+    assert output[2:] == [
+        f"Position: {i}, Seed: {value}" for i, value in enumerate(outputs[:3])
+    ]
+    output = subprocess.run(
+        command + ["-i", "3"], capture_output=True, text=True, check=True
+    ).stdout
+    assert output == f"Final Seed: {outputs[3]}\n"
+
+
+def test_cli_negative_iterations():
+    # Negative iterations are clamped to zero in both command line tools
+    for module, flag in (("lehmer.cli", "-z"), ("lehmer.simple", "-s")):
+        outputs = [
+            subprocess.run(
+                [sys.executable, "-m", module, flag, "7", "-i", iterations],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            for iterations in ("-3", "0")
+        ]
+        assert outputs[0].replace("-3", "0") == outputs[1]
 
-    while seed is not original_seed and count < rng.m - 1:
-        rng.z = rng.generate()  # generate a new seed every cycle
-        count += 1
 
-    assert count == (rng.m - 1)
+def test_prime_parameters():
+    assert is_prime(Lehmer.a)
+    assert is_prime(Lehmer.m)
+
+
+def test_full_period():
+    # The period is m - 1 iff a is a primitive root of the prime m, i.e.
+    # a^((m - 1) / p) != 1 (mod m) for every prime p dividing m - 1
+    a, m = Lehmer.a, Lehmer.m
+    factors = (2, 3, 7, 11, 31, 151, 331)  # Distinct prime factors of m - 1
+    assert 2 * 3**2 * 7 * 11 * 31 * 151 * 331 == m - 1
+    assert all(pow(a, (m - 1) // p, m) != 1 for p in factors)
 
 
 #
@@ -102,19 +250,78 @@ def test_distribution():
     assert abs(variance - 1 / 12) < 0.01
 
 
+def test_stream_distribution():
+    sequence = Lehmer(123456789).stream(10000)
+
+    mean = sum(sequence) / len(sequence)
+    variance = sum((x - mean) ** 2 for x in sequence) / len(sequence)
+
+    assert abs(mean - 0.5) < 0.01
+    assert abs(variance - 1 / 12) < 0.01
+
+
 def test_non_prime_multiplier():
-    rng = Lehmer(123456789)
-    rng._a = 48270  # Example non-prime multiplier
+    class NonPrimeLehmer(Lehmer):
+        a = 48270  # Example non-prime multiplier
+
+    rng = NonPrimeLehmer(123456789)
     sequence = [rng.y_random() for _ in range(10000)]
     mean = sum(sequence) / len(sequence)
     assert abs(mean - 0.5) < 0.01
 
+    # The derived gamma constants must follow the subclass multiplier
+    rng = NonPrimeLehmer(123456789)
+    assert rng.y_random() == (48270 * 123456789 % rng.m) / rng.m
+    rng = NonPrimeLehmer(123456789)
+    assert rng.random() == (48270 * 123456789 % rng.m) / rng.m
+
+
+def test_subclass_bulk():
+    # liblehmer is fixed to the default constants, so a subclass with its
+    # own multiplier must produce the same bulk output with LEHMER_LIBRARY set
+    class NonPrimeLehmer(Lehmer):
+        a = 48270  # Example non-prime multiplier
+
+    m, z, seeds = Lehmer.m, 123456789, []
+    for _ in range(100):
+        z = (48270 * z) % m
+        seeds.append(z)
+    expected = [z / m for z in seeds]
+    rng = NonPrimeLehmer(123456789)
+    assert list(rng.stream(100)) == expected
+    assert rng.z == seeds[-1]
+    rng = NonPrimeLehmer(123456789)
+    assert list(rng.generate_batch(100)) == seeds
+    assert rng.z == seeds[-1]
+    rng = NonPrimeLehmer(123456789)
+    assert list(rng.stream_f32(100)) == [(z >> 7) * 2.0**-24 for z in seeds]
+    rng = NonPrimeLehmer(123456789)
+    assert list(rng.bernoulli(100, 0.3)) == [int(v < 0.3) for v in expected]
+    assert rng.z == seeds[-1]
+
 
 if __name__ == "__main__":
     test_seed_setting()
     test_generate_sequence()
+    test_stream()
+    test_generate_batch()
+    test_iter()
+    test_advance()
+    test_spawn()
+    test_pool()
+    test_stream_f32()
+    test_bernoulli()
+    test_random_array()
     test_normalize()
+    test_simple_negative_seed()
+    test_pcg32()
+    test_cli_pcg()
+    test_cli_negative_iterations()
+    test_prime_parameters()
+    test_full_period()
     test_seed_range()
     test_distribution()
+    test_stream_distribution()
     test_non_prime_multiplier()
+    test_subclass_bulk()
     print("Silence is golden <3")
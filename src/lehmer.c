@@ -193,14 +193,16 @@ int32_t lehmer_generate_gamma(int32_t seed) {
     uint32_t a = LEHMER_MULTIPLIER;
     uint32_t m = LEHMER_MODULUS;
     int32_t y = lehmer_calculate_gamma(seed, a, m);
-    return lehmer_seed_normalize_to_int(y);
+    // Schrage's decomposition leaves gamma in (-m, m), so one add binds it
+    return y < 0 ? y + (int64_t) m : y;
 }
 
 int32_t lehmer_generate_jump(int32_t seed) {
     uint32_t a = LEHMER_JUMP;
     uint32_t m = LEHMER_MODULUS;
     int32_t j = lehmer_calculate_gamma(seed, a, m);
-    return lehmer_seed_normalize_to_int(j);
+    // Schrage's decomposition leaves gamma in (-m, m), so one add binds it
+    return j < 0 ? j + (int64_t) m : j;
 }
 
 int32_t lehmer_generate_delta(int32_t seed) {
@@ -235,7 +237,8 @@ void lehmer_generate(
         uint32_t previous = current - 1;
 
         // Use the previous sequence value as the seed for the next
-        int32_t previous_seed = state->sequence[previous] % LEHMER_MODULUS;
+        // NOTE: Generator output is already bound to the modulus
+        int32_t previous_seed = state->sequence[previous];
 
         // Generate the next value and store it in the current position
         state->sequence[current] = generator(previous_seed);
@@ -262,6 +265,120 @@ void lehmer_regenerate(lehmer_state_t* state, lehmer_generate_t generator) {
     lehmer_generate(state, generator, seed);
 }
 
+// Number of interleaved streams stepped together by the stream kernel
+#define LEHMER_LANES 8
+
+// Reduce a product of two values below 2^31 by the Mersenne modulus
+static inline uint64_t lehmer_fold_mersenne(uint64_t product) {
+    // 2^31 = 1 (mod m), so fold the high bits onto the low bits
+    product = (product & LEHMER_MODULUS) + (product >> 31);
+    product = (product & LEHMER_MODULUS) + (product >> 31);
+    // NOTE: The select compiles to a conditional move, so it is already
+    // branchless; an explicit mask and subtract measured no faster
+    return product >= LEHMER_MODULUS ? product - LEHMER_MODULUS : product;
+}
+
+// Seed the leapfrog lanes and return the multiplier that leaps each lane
+static inline uint64_t lehmer_seed_lanes(uint64_t* lanes, int32_t seed) {
+    // Widen the seed so the product never overflows
+    int64_t reduced = seed % LEHMER_MODULUS;
+    uint64_t z = reduced < 0 ? reduced + LEHMER_MODULUS : reduced;
+
+    // Leapfrog: lane k holds z_(i + k) and jumps ahead by a^L each step, so
+    // the lanes interleave into the serial sequence without a dependency chain
+    uint64_t leap = 1;
+    for (uint32_t k = 0; k < LEHMER_LANES; k++) {
+        z = lehmer_fold_mersenne(LEHMER_MULTIPLIER * z);
+        lanes[k] = z;
+        leap = lehmer_fold_mersenne(LEHMER_MULTIPLIER * leap);
+    }
+    return leap;
+}
+
+// Fill a buffer with seeds from the modulo generator
+void lehmer_generate_batch(int32_t* output, int32_t seed, uint32_t length) {
+    uint64_t lanes[LEHMER_LANES];
+    uint64_t leap = lehmer_seed_lanes(lanes, seed);
+
+    uint32_t i = 0;
+    for (; i + LEHMER_LANES <= length; i += LEHMER_LANES) {
+        for (uint32_t k = 0; k < LEHMER_LANES; k++) {
+            output[i + k] = (int32_t) lanes[k];
+            lanes[k] = lehmer_fold_mersenne(leap * lanes[k]);
+        }
+    }
+
+    // The remainder is already computed in the leading lanes
+    for (uint32_t k = 0; i < length; i++, k++) {
+        output[i] = (int32_t) lanes[k];
+    }
+}
+
+// Fill a buffer with normalized values from the modulo generator
+void lehmer_generate_stream(double* output, int32_t seed, uint32_t length) {
+    uint64_t lanes[LEHMER_LANES];
+    uint64_t leap = lehmer_seed_lanes(lanes, seed);
+
+    uint32_t i = 0;
+    for (; i + LEHMER_LANES <= length; i += LEHMER_LANES) {
+        for (uint32_t k = 0; k < LEHMER_LANES; k++) {
+            output[i + k] = (double) lanes[k] / (double) LEHMER_MODULUS;
+            lanes[k] = lehmer_fold_mersenne(leap * lanes[k]);
+        }
+    }
+
+    // The remainder is already computed in the leading lanes
+    for (uint32_t k = 0; i < length; i++, k++) {
+        output[i] = (double) lanes[k] / (double) LEHMER_MODULUS;
+    }
+}
+
+// Fill a buffer with single precision values from the modulo generator
+void lehmer_generate_stream_f32(float* output, int32_t seed, uint32_t length) {
+    uint64_t lanes[LEHMER_LANES];
+    uint64_t leap = lehmer_seed_lanes(lanes, seed);
+
+    // Keep the top 24 of 31 bits, which a float holds exactly, below 1.0
+    const float scale = 1.0f / (float) (1 << 24);
+
+    uint32_t i = 0;
+    for (; i + LEHMER_LANES <= length; i += LEHMER_LANES) {
+        for (uint32_t k = 0; k < LEHMER_LANES; k++) {
+            output[i + k] = (float) (lanes[k] >> 7) * scale;
+            lanes[k] = lehmer_fold_mersenne(leap * lanes[k]);
+        }
+    }
+
+    // The remainder is already computed in the leading lanes
+    for (uint32_t k = 0; i < length; i++, k++) {
+        output[i] = (float) (lanes[k] >> 7) * scale;
+    }
+}
+
+// Fill a buffer with Bernoulli outcomes from the modulo generator
+void lehmer_generate_bernoulli(
+    uint8_t* output, int32_t seed, uint32_t length, double p
+) {
+    uint64_t lanes[LEHMER_LANES];
+    uint64_t leap = lehmer_seed_lanes(lanes, seed);
+
+    // z / m < p iff z < p * m, so the seeds are never normalized
+    double threshold = p * (double) LEHMER_MODULUS;
+
+    uint32_t i = 0;
+    for (; i + LEHMER_LANES <= length; i += LEHMER_LANES) {
+        for (uint32_t k = 0; k < LEHMER_LANES; k++) {
+            output[i + k] = (double) lanes[k] < threshold;
+            lanes[k] = lehmer_fold_mersenne(leap * lanes[k]);
+        }
+    }
+
+    // The remainder is already computed in the leading lanes
+    for (uint32_t k = 0; i < length; i++, k++) {
+        output[i] = (double) lanes[k] < threshold;
+    }
+}
+
 // Lehmer number generators
 
 // Generate a random number using the modulo approach.
@@ -357,6 +357,33 @@ int test_seed_generation(void) {
     return passed ? 0 : 1;
 }
 
+int test_binder_matches_modulo(void) {
+    bool passed = true;
+
+    // sweep seeds across [1, m) with a stride coprime to m
+    for (int64_t z = 1; z < LEHMER_MODULUS; z += 4099) {
+        int32_t expected = lehmer_generate_modulo(z);
+        int32_t binder = lehmer_generate_binder(z);
+        int32_t gamma = lehmer_generate_gamma(z);
+
+        if (binder != expected || gamma != expected) {
+            LOG_ERROR(
+                "test_binder_matches_modulo: Expected %d for z = %d, but got "
+                "binder = %d and gamma = %d.\n",
+                expected,
+                (int32_t) z,
+                binder,
+                gamma
+            );
+            passed = false;
+            break;
+        }
+    }
+
+    printf("%s", passed ? "." : "x");
+    return passed ? 0 : 1;
+}
+
 int test_jump_state(void) {
     const int32_t expected_seed = LEHMER_CHECK_JUMP;
     lehmer_state_t* state = setup_lehmer_state();
@@ -441,6 +468,7 @@ int main(void) {
     passed |= test_lehmer_seed_normalize();
     passed |= test_random_seed_and_normalize();
     passed |= test_seed_generation();
+    passed |= test_binder_matches_modulo();
     // passed |= test_jump_state();
     // passed |= test_full_period();
     printf("\n");